@@ -4,21 +4,177 @@ LinkedIn Company Page Monitor & Data Extractor - Enhanced Version
 Smart filename generation and manual page progression
 """
 
-import pandas as pd
+import csv
 import time
 import random
-import json
 import os
 import re
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, JavascriptException, StaleElementReferenceException,
+    NoSuchWindowException, InvalidSessionIdException
+)
+from urllib3.exceptions import MaxRetryError
 from selenium.webdriver.common.keys import Keys
 
+# Precompiled patterns for filename sanitization and company detection
+_BAD_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_DASHES_RE = re.compile(r'-+')
+_EMPLOYEES_RE = re.compile(r'(.+?)\s+employees', re.IGNORECASE)
+
+# Resources never needed for extraction, blocked via CDP to cut page weight
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.mp4",
+    "*platform.linkedin.com/lite*",
+    "*px.ads.linkedin.com*"
+]
+
+# Selector lists for the different LinkedIn page layouts, in priority order.
+# For cards the first selector with any match wins; for fields the first
+# selector whose element has usable text wins.
+PROFILE_CARD_SELECTORS = [
+    # Company people page
+    '.org-people-profile-card',
+    '.org-people-profile-card__profile-info',
+    
+    # Search results page
+    '.entity-result',
+    '.entity-result__item',
+    
+    # General profile cards
+    '.profile-card',
+    
+    # List view
+    '.reusable-search__result-container',
+    '.search-results-container .entity-result'
+]
+
+PROFILE_URL_SELECTORS = [
+    'a[href*="/in/"]',
+    'a',
+    '[href*="/in/"]'
+]
+
+NAME_SELECTORS = [
+    'div.lt-line-clamp.lt-line-clamp--single-line',
+    '.org-people-profile-card__profile-title',
+    '.entity-result__title-text a span[aria-hidden="true"]',
+    '.entity-result__title-text',
+    'h3 a span[aria-hidden="true"]',
+    'h3 span[aria-hidden="true"]',
+    '.profile-card__title',
+    '.name',
+    'h3',
+    '.t-16.t-black.t-bold',
+    '.search-result__result-link span[aria-hidden="true"]',
+    'span[aria-hidden="true"]'
+]
+
+TITLE_SELECTORS = [
+    '.org-people-profile-card__profile-subtitle',
+    '.entity-result__primary-subtitle',
+    '.entity-result__subtitle',
+    '.profile-card__subtitle',
+    '.title',
+    '.t-14.t-black--light.t-normal',
+    '.entity-result__summary'
+]
+
+LOCATION_SELECTORS = [
+    '.entity-result__secondary-subtitle',
+    '.org-people-profile-card__meta',
+    '.profile-card__meta',
+    '.location',
+    '.t-12.t-black--light.t-normal'
+]
+
+# Shared in-page helpers: first usable text from a selector list, tried in priority order
+JS_HELPERS = """
+    function firstText(root, selectors, allowDigits) {
+        for (var i = 0; i < selectors.length; i++) {
+            var node = root.querySelector(selectors[i]);
+            if (!node) {
+                continue;
+            }
+            var text = (node.innerText || '').trim();
+            if (text.length > 1 && (allowDigits || !/^\\d+$/.test(text))) {
+                return text;
+            }
+        }
+        return null;
+    }
+"""
+
+# Runs in the browser and returns every profile card's fields in one round-trip.
+# Arguments: card, url, name, title and location selector lists.
+JS_EXTRACT = JS_HELPERS + """
+    var cardSelectors = arguments[0], urlSelectors = arguments[1], nameSelectors = arguments[2],
+        titleSelectors = arguments[3], locationSelectors = arguments[4];
+    
+    function profileUrl(card) {
+        for (var i = 0; i < urlSelectors.length; i++) {
+            var link = card.querySelector(urlSelectors[i]);
+            var href = link ? link.getAttribute('href') : null;
+            if (href && href.indexOf('/in/') !== -1) {
+                return new URL(href, location.href).href;
+            }
+        }
+        return null;
+    }
+    
+    // The first card selector with any match wins
+    var cards = [];
+    for (var i = 0; i < cardSelectors.length && cards.length === 0; i++) {
+        cards = Array.from(document.querySelectorAll(cardSelectors[i]));
+    }
+    
+    return cards.map(function (card) {
+        return {
+            name: firstText(card, nameSelectors, false),
+            title: firstText(card, titleSelectors, true),
+            location: firstText(card, locationSelectors, true),
+            profile_url: profileUrl(card)
+        };
+    });
+"""
+
+# Fallback when no profile cards are found: every LinkedIn profile link on the page,
+# with the name shown inside the link. Argument: name selector list.
+JS_PROFILE_LINKS = JS_HELPERS + """
+    var nameSelectors = arguments[0];
+    
+    function linkName(link) {
+        var name = firstText(link, nameSelectors, false);
+        if (name) {
+            return name;
+        }
+        var text = (link.innerText || '').trim().split('\\n')[0].trim();
+        return text.length > 1 && !/^\\d+$/.test(text) ? text : null;
+    }
+    
+    return Array.from(document.querySelectorAll('a[href*="/in/"]'))
+        .filter(function (link) { return link.href.indexOf('linkedin.com') !== -1; })
+        .map(function (link) { return {profile_url: link.href, name: linkName(link)}; });
+"""
+
+# Current URL, first card's profile link and card link count, used to tell one results
+# page from the next (the count catches "next" buttons that append results in place).
+# Argument: card-scoped profile link selector group.
+JS_PAGE_SIGNATURE = """
+    var links = document.querySelectorAll(arguments[0]);
+    return [location.href, links.length ? links[0].href : null, links.length];
+"""
+
 class LinkedInCompanyMonitor:
     def __init__(self):
         self.setup_driver()
@@ -26,34 +182,60 @@ class LinkedInCompanyMonitor:
         self.extraction_active = False
         self.current_page_data = []
         
+        # Selector groups pre-joined for the page load waits
+        self._card_sel = ", ".join(PROFILE_CARD_SELECTORS)
+        self._card_link_sel = ", ".join(f'{selector} a[href*="/in/"]' for selector in PROFILE_CARD_SELECTORS)
+        
+        # Next page extracted in the background while the user approves the current one
+        self._pending = None
+        self._pending_error = None
+        self._pending_log = []
+        self._prefetch_from_url = None
+        
     def setup_driver(self):
         """Setup Chrome driver with enhanced options"""
         opts = Options()
         opts.add_argument("--disable-blink-features=AutomationControlled")
         opts.add_experimental_option("excludeSwitches", ["enable-automation"])
         opts.add_experimental_option('useAutomationExtension', False)
+        # Don't download profile avatars, they are never extracted
+        opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
         opts.add_argument("--disable-extensions")
         opts.add_argument("--disable-plugins")
         opts.add_argument("--no-sandbox")
         opts.add_argument("--disable-dev-shm-usage")
+        # Reuse one profile across runs so the login session and HTTP cache stay warm
+        opts.add_argument(f"--user-data-dir={os.path.abspath('./chrome_profile')}")
+        opts.add_argument("--profile-directory=Default")
+        # Return on DOMContentLoaded instead of waiting for late tracking requests
+        opts.page_load_strategy = 'eager'
         
         self.driver = webdriver.Chrome(options=opts)
         self.driver.maximize_window()
         
+        # Block fonts, media and tracking requests at the network layer
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"⚠️  Could not enable request blocking: {str(e)}")
+        
     def generate_smart_filename(self, url, page_title):
         """Generate smart filename based on LinkedIn URL structure"""
         try:
             print(f"🔍 Analyzing URL: {url}")
             print(f"📄 Page title: {page_title}")
             
+            # Parse the URL once and dispatch on its first path segment
+            parsed = urllib.parse.urlparse(url)
+            path_parts = parsed.path.strip('/').split('/')
+            section = path_parts[0]
+            
             # Extract LinkedIn profile pattern
             # Pattern: https://www.linkedin.com/in/firstname-lastname-restofid
-            if '/in/' in url:
-                # Extract the part after /in/
-                profile_part = url.split('/in/')[-1]
-                # Remove any query parameters
-                profile_part = profile_part.split('?')[0].split('/')[0]
+            if section == 'in':
+                profile_part = path_parts[1] if len(path_parts) > 1 else ''
                 
                 # Split by dash and take first two parts
                 parts = profile_part.split('-')
@@ -74,12 +256,11 @@ class LinkedInCompanyMonitor:
                     return self.sanitize_filename(filename)
             
             # For company pages, extract company name from URL
-            elif '/company/' in url:
-                company_part = url.split('/company/')[-1]
-                company_name = company_part.split('/')[0]
+            elif section == 'company' and len(path_parts) > 1:
+                company_name = path_parts[1]
                 
                 # If it's a people page, add that info
-                if '/people/' in url:
+                if 'people' in path_parts[2:]:
                     filename = f"{company_name}-employees"
                 else:
                     filename = company_name
@@ -88,17 +269,14 @@ class LinkedInCompanyMonitor:
                 return self.sanitize_filename(filename)
             
             # For search results, extract search terms
-            elif '/search/' in url:
+            elif section == 'search':
                 # Try to extract search keywords from URL
-                if 'keywords=' in url:
-                    import urllib.parse
-                    parsed = urllib.parse.urlparse(url)
-                    params = urllib.parse.parse_qs(parsed.query)
-                    keywords = params.get('keywords', [''])[0]
-                    if keywords:
-                        filename = f"search-{keywords.replace(' ', '-')}"
-                        print(f"✅ Generated filename from search: {filename}")
-                        return self.sanitize_filename(filename)
+                params = urllib.parse.parse_qs(parsed.query)
+                keywords = params.get('keywords', [''])[0]
+                if keywords:
+                    filename = f"search-{keywords.replace(' ', '-')}"
+                    print(f"✅ Generated filename from search: {filename}")
+                    return self.sanitize_filename(filename)
                 
                 # Fallback to page title analysis
                 if 'people' in page_title.lower():
@@ -126,33 +304,27 @@ class LinkedInCompanyMonitor:
     def sanitize_filename(self, filename):
         """Sanitize filename for saving"""
         # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = _BAD_CHARS_RE.sub('_', filename)
         # Remove extra spaces and convert to lowercase
         filename = filename.strip().lower()
         # Replace spaces with dash
         filename = filename.replace(' ', '-')
         # Remove multiple dashes
-        filename = re.sub(r'-+', '-', filename)
+        filename = _DASHES_RE.sub('-', filename)
         # Limit length
         filename = filename[:100]
         return filename
     
-    def detect_company_page(self):
-        """Detect if current page is a LinkedIn company page"""
-        try:
-            current_url = self.driver.current_url
-            
-            # Check if it's a company page
-            if '/company/' in current_url and '/people/' in current_url:
-                return True
-            elif '/search/results/people/' in current_url:
-                return True
-            elif 'linkedin.com' in current_url and any(keyword in current_url.lower() for keyword in ['company', 'people', 'employees']):
-                return True
-            
-            return False
-        except Exception as e:
-            return False
+    def detect_company_page(self, current_url):
+        """Detect if the given URL is a LinkedIn company page"""
+        # Check the exact page patterns first, then lowercase once for the keyword test
+        if '/company/' in current_url and '/people/' in current_url:
+            return True
+        if '/search/results/people/' in current_url:
+            return True
+        
+        url_l = current_url.lower()
+        return 'linkedin.com' in url_l and ('company' in url_l or 'people' in url_l or 'employees' in url_l)
     
     def get_page_title(self):
         """Get current page title"""
@@ -162,176 +334,80 @@ class LinkedInCompanyMonitor:
         except:
             return "linkedin_data"
     
-    def extract_profiles_from_current_page(self):
-        """Extract all profile data from current page"""
+    def extract_profiles_from_current_page(self, log=print):
+        """Extract all profile data from current page (log receives the progress messages)"""
         profiles = []
         
-        print("🔍 Extracting profiles from current page...")
+        log("🔍 Extracting profiles from current page...")
         
-        # Multiple selectors for different LinkedIn page types
-        profile_selectors = [
-            # Company people page
-            '.org-people-profile-card',
-            '.org-people-profile-card__profile-info',
-            
-            # Search results page
-            '.entity-result',
-            '.entity-result__item',
-            
-            # General profile cards
-            '.search-result__result-link',
-            '.app-aware-link',
-            '.profile-card',
-            
-            # List view
-            '.reusable-search__result-container',
-            '.search-results-container .entity-result'
-        ]
+        try:
+            page_title = self.driver.title
+        except Exception:
+            page_title = ""
         
-        found_profiles = []
+        # Company name comes from the page title, so resolve it once per page
+        company = 'Not found'
+        if 'employees' in page_title.lower():
+            company_match = _EMPLOYEES_RE.search(page_title)
+            if company_match:
+                company = company_match.group(1).strip()
         
-        for selector in profile_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"  ✅ Found {len(elements)} profiles using selector: {selector}")
-                    found_profiles = elements
-                    break
-            except:
-                continue
+        # Every card on the page is extracted within milliseconds, so stamp them all at once
+        extracted_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        if not found_profiles:
-            print("  ❌ No profiles found with standard selectors, trying alternative approach...")
-            # Try to find any links that look like profile links
-            try:
-                all_links = self.driver.find_elements(By.TAG_NAME, 'a')
-                for link in all_links:
-                    href = link.get_attribute('href')
-                    if href and '/in/' in href and 'linkedin.com' in href:
-                        found_profiles.append(link)
-                print(f"  ✅ Found {len(found_profiles)} profile links via alternative method")
-            except:
-                pass
+        # Walk the DOM in the browser and bring every card back in a single round-trip
+        try:
+            records = self.driver.execute_script(
+                JS_EXTRACT, PROFILE_CARD_SELECTORS, PROFILE_URL_SELECTORS,
+                NAME_SELECTORS, TITLE_SELECTORS, LOCATION_SELECTORS
+            )
+        except Exception as e:
+            log(f"  ❌ In-page extraction failed: {str(e)}")
+            return profiles
         
-        # Extract data from found profiles
-        for i, profile_element in enumerate(found_profiles):
+        if records:
+            log(f"  ✅ Found {len(records)} profiles")
+        else:
+            log("  ❌ No profiles found with standard selectors, trying alternative approach...")
+            # Collect every profile link on the page in a single round-trip
             try:
-                profile_data = self.extract_single_profile_data(profile_element)
-                if profile_data and profile_data not in profiles:
-                    profiles.append(profile_data)
-                    print(f"  📊 {i+1}. {profile_data.get('name', 'Unknown')} - {profile_data.get('title', 'No title')}")
+                records = self.driver.execute_script(JS_PROFILE_LINKS, NAME_SELECTORS)
             except Exception as e:
-                print(f"  ⚠️  Error extracting profile {i+1}: {str(e)}")
+                log(f"  ⚠️  Could not collect profile links: {str(e)}")
+                records = []
+            log(f"  ✅ Found {len(records)} profile links via alternative method")
+        found_profiles = [self.extract_single_profile_data(record, company, extracted_at) for record in records]
+        
+        # Dedupe on profile URL; cards without one fall back to their visible fields.
+        # When a profile appears twice (e.g. avatar link and name link), keep the named one.
+        index_by_key = {}
+        for profile_data in found_profiles:
+            if not profile_data:
                 continue
+            key = profile_data['profile_url']
+            if key == 'Not found':
+                key = (profile_data['name'], profile_data['title'], profile_data['location'])
+            if key not in index_by_key:
+                index_by_key[key] = len(profiles)
+                profiles.append(profile_data)
+            elif profiles[index_by_key[key]]['name'] == 'Not found' and profile_data['name'] != 'Not found':
+                profiles[index_by_key[key]] = profile_data
+        
+        for i, profile_data in enumerate(profiles):
+            log(f"  📊 {i+1}. {profile_data.get('name', 'Unknown')} - {profile_data.get('title', 'No title')}")
         
         return profiles
     
-    def extract_single_profile_data(self, profile_element):
-        """Extract data from a single profile element"""
-        try:
-            # Initialize profile data
-            profile_data = {
-                'name': 'Not found',
-                'title': 'Not found',
-                'location': 'Not found',
-                'profile_url': 'Not found',
-                'company': 'Not found',
-                'extracted_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Try to get profile URL
-            url_selectors = ['a[href*="/in/"]', 'a', '[href*="/in/"]']
-            for selector in url_selectors:
-                try:
-                    url_element = profile_element.find_element(By.CSS_SELECTOR, selector)
-                    href = url_element.get_attribute('href')
-                    if href and '/in/' in href:
-                        profile_data['profile_url'] = href
-                        break
-                except:
-                    continue
-            
-            # Try to get name
-            name_selectors = [
-                'div.lt-line-clamp.lt-line-clamp--single-line',  # Specific to the class you provided
-                '.org-people-profile-card__profile-title',
-                '.entity-result__title-text a span[aria-hidden="true"]',
-                '.entity-result__title-text',
-                'h3 a span[aria-hidden="true"]',
-                'h3 span[aria-hidden="true"]',
-                '.profile-card__title',
-                '.name',
-                'h3',
-                '.t-16.t-black.t-bold',
-                '.search-result__result-link span[aria-hidden="true"]',
-                'span[aria-hidden="true"]'
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_element = profile_element.find_element(By.CSS_SELECTOR, selector)
-                    name_text = name_element.text.strip()
-                    if name_text and len(name_text) > 1 and not name_text.isdigit():
-                        profile_data['name'] = name_text 
-                        break
-                except:
-                    continue
-            
-            # Try to get title/position
-            title_selectors = [
-                '.org-people-profile-card__profile-subtitle',
-                '.entity-result__primary-subtitle',
-                '.entity-result__subtitle',
-                '.profile-card__subtitle',
-                '.title',
-                '.t-14.t-black--light.t-normal',
-                '.entity-result__summary'
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = profile_element.find_element(By.CSS_SELECTOR, selector)
-                    title_text = title_element.text.strip()
-                    if title_text and len(title_text) > 1:
-                        profile_data['title'] = title_text
-                        break
-                except:
-                    continue
-            
-            # Try to get location
-            location_selectors = [
-                '.entity-result__secondary-subtitle',
-                '.org-people-profile-card__meta',
-                '.profile-card__meta',
-                '.location',
-                '.t-12.t-black--light.t-normal'
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_element = profile_element.find_element(By.CSS_SELECTOR, selector)
-                    location_text = location_element.text.strip()
-                    if location_text and len(location_text) > 1:
-                        profile_data['location'] = location_text
-                        break
-                except:
-                    continue
-            
-            # Try to extract company from page context
-            try:
-                page_title = self.driver.title
-                if 'employees' in page_title.lower():
-                    company_match = re.search(r'(.+?)\s+employees', page_title, re.IGNORECASE)
-                    if company_match:
-                        profile_data['company'] = company_match.group(1).strip()
-            except:
-                pass
-            
-            return profile_data
-            
-        except Exception as e:
-            print(f"    ⚠️  Error in extract_single_profile_data: {str(e)}")
-            return None
+    def extract_single_profile_data(self, record, company, extracted_at):
+        """Build a profile row from the raw fields scraped for one card"""
+        return {
+            'name': record.get('name') or 'Not found',
+            'title': record.get('title') or 'Not found',
+            'location': record.get('location') or 'Not found',
+            'profile_url': record.get('profile_url') or 'Not found',
+            'company': company,
+            'extracted_at': extracted_at
+        }
     
     def check_for_next_page(self):
         """Check if there's a next page"""
@@ -379,21 +455,76 @@ class LinkedInCompanyMonitor:
         
         return None
     
+    def get_page_signature(self):
+        """Get the current URL, first profile link and link count, to detect a page change"""
+        return self.driver.execute_script(JS_PAGE_SIGNATURE, self._card_link_sel)
+    
+    def wait_for_profiles(self, previous_page=None):
+        """Wait until profile cards are present instead of sleeping a fixed time"""
+        # After a click the old cards stay in the DOM (or get reused/appended to), so
+        # wait for the URL, the first profile or the number of cards to change before extracting
+        if previous_page is not None:
+            try:
+                # Scripts can fail while the page is mid-navigation: keep polling through those
+                WebDriverWait(
+                    self.driver, 10, ignored_exceptions=(JavascriptException, StaleElementReferenceException)
+                ).until(lambda driver: self.get_page_signature() != previous_page)
+            except TimeoutException:
+                raise TimeoutException("next page did not load (URL and profile cards unchanged after 10s)")
+        
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self._card_sel))
+            )
+            return True
+        except TimeoutException:
+            # No cards rendered (e.g. link-only layout): give the page a short grace period
+            time.sleep(random.uniform(1, 2))
+            return False
+    
+    def prefetch_next_page(self, next_button):
+        """Navigate to the next page and extract it (runs in a background thread)"""
+        self._pending = None
+        self._pending_error = None
+        self._pending_log = []
+        self._prefetch_from_url = None
+        try:
+            # Remember the current page so we can tell when it has been replaced
+            previous_page = self.get_page_signature()
+            self._prefetch_from_url = previous_page[0]
+            self.driver.execute_script("arguments[0].click();", next_button)
+            self.wait_for_profiles(previous_page)
+            
+            # Buffer the progress output so it doesn't print over the approval prompt
+            self._pending = self.extract_profiles_from_current_page(log=self._pending_log.append)
+        except Exception as e:
+            self._pending_error = e
+    
     def extract_all_pages_with_approval(self):
         """Extract data from all pages with manual approval"""
         all_profiles = []
+        seen_urls = set()
         page_number = 1
+        profiles = None
+        
+        # Wait for the first page; later pages are waited for by the prefetch
+        self.wait_for_profiles()
         
         while True:
             print(f"\n" + "="*60)
             print(f"📄 PROCESSING PAGE {page_number}")
             print("="*60)
             
-            # Wait for page to load
-            time.sleep(random.uniform(2, 4))
+            # Extract profiles from current page, unless it was already prefetched
+            if profiles is None:
+                profiles = self.extract_profiles_from_current_page()
+            else:
+                for message in self._pending_log:
+                    print(message)
             
-            # Extract profiles from current page
-            profiles = self.extract_profiles_from_current_page()
+            # Pages that append results keep the earlier cards, so drop profiles already collected
+            profiles = [p for p in profiles if p['profile_url'] == 'Not found' or p['profile_url'] not in seen_urls]
+            seen_urls.update(p['profile_url'] for p in profiles)
             
             if profiles:
                 all_profiles.extend(profiles)
@@ -422,26 +553,37 @@ class LinkedInCompanyMonitor:
                 print(f"  📈 Total profiles: {len(all_profiles)}")
                 print(f"\n⏸️  Ready to move to page {page_number + 1}")
                 
-                # Wait for user approval
-                user_input = input("   Press ENTER to continue to next page, or type 'q' to quit: ").strip().lower()
+                # Load and extract the next page while waiting for the user
+                prefetch = threading.Thread(target=self.prefetch_next_page, args=(next_button,), daemon=True)
+                prefetch.start()
+                
+                # Wait for user approval. The driver isn't thread-safe, so always wait for the
+                # prefetch before touching it again, even if the prompt is interrupted (Ctrl+C)
+                try:
+                    user_input = input("   Press ENTER to continue to next page, or type 'q' to quit: ").strip().lower()
+                finally:
+                    if prefetch.is_alive():
+                        print("  ⏳ Waiting for next page to load...")
+                    prefetch.join()
                 
                 if user_input == 'q':
+                    # The prefetch already clicked "Next": go back to the page the user stayed on
+                    try:
+                        if self._prefetch_from_url and self.driver.current_url != self._prefetch_from_url:
+                            self.driver.back()
+                    except Exception as e:
+                        print(f"  ⚠️  Could not return to page {page_number}: {str(e)}")
                     print("🛑 Extraction stopped by user")
                     break
                 
-                # Navigate to next page
-                try:
-                    print(f"  ➡️  Moving to page {page_number + 1}...")
-                    self.driver.execute_script("arguments[0].click();", next_button)
-                    page_number += 1
-                    
-                    # Add a longer delay after clicking next
-                    print("  ⏳ Waiting for next page to load...")
-                    time.sleep(random.uniform(3, 5))
-                    
-                except Exception as e:
-                    print(f"  ❌ Error navigating to next page: {str(e)}")
+                # Move on to the prefetched page
+                if self._pending_error is not None:
+                    print(f"  ❌ Error navigating to next page: {str(self._pending_error)}")
                     break
+                
+                print(f"  ➡️  Moving to page {page_number + 1}...")
+                profiles = self._pending
+                page_number += 1
             else:
                 print(f"\n🏁 No more pages available")
                 print("   Either reached the end or no next button found")
@@ -471,38 +613,44 @@ class LinkedInCompanyMonitor:
         # Add timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Save as CSV
         csv_filename = os.path.join(output_dir, f"{filename_base}_{timestamp}.csv")
-        df = pd.DataFrame(profiles)
-        df.to_csv(csv_filename, index=False)
-        
-        # Save as JSON
         json_filename = os.path.join(output_dir, f"{filename_base}_{timestamp}.json")
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(profiles, f, indent=2, ensure_ascii=False)
+        metadata_filename = os.path.join(output_dir, f"{filename_base}_{timestamp}_metadata.json")
         
-        print(f"\n💾 DATA SAVED SUCCESSFULLY!")
-        print(f"📁 Location: {output_dir}/")
-        print(f"📊 CSV file: {os.path.basename(csv_filename)}")
-        print(f"📋 JSON file: {os.path.basename(json_filename)}")
-        print(f"🔢 Total records: {len(profiles)}")
+        # Count populated fields in a single pass
+        n_name = n_title = n_loc = 0
+        for p in profiles:
+            n_name += p.get('name') != 'Not found'
+            n_title += p.get('title') != 'Not found'
+            n_loc += p.get('location') != 'Not found'
         
-        # Save extraction metadata
+        # Extraction metadata
         metadata = {
             'extraction_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'source_url': current_url,
             'page_title': page_title,
             'filename_base': filename_base,
             'total_profiles': len(profiles),
-            'profiles_with_names': sum(1 for p in profiles if p.get('name') != 'Not found'),
-            'profiles_with_titles': sum(1 for p in profiles if p.get('title') != 'Not found'),
-            'profiles_with_locations': sum(1 for p in profiles if p.get('location') != 'Not found')
+            'profiles_with_names': n_name,
+            'profiles_with_titles': n_title,
+            'profiles_with_locations': n_loc
         }
         
-        metadata_filename = os.path.join(output_dir, f"{filename_base}_{timestamp}_metadata.json")
-        with open(metadata_filename, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        # The three outputs are independent, so write them in parallel
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.write_csv, csv_filename, profiles),
+                executor.submit(self.write_json, json_filename, profiles),
+                executor.submit(self.write_json, metadata_filename, metadata)
+            ]
+            for future in futures:
+                future.result()
         
+        print(f"\n💾 DATA SAVED SUCCESSFULLY!")
+        print(f"📁 Location: {output_dir}/")
+        print(f"📊 CSV file: {os.path.basename(csv_filename)}")
+        print(f"📋 JSON file: {os.path.basename(json_filename)}")
+        print(f"🔢 Total records: {len(profiles)}")
         print(f"📋 Metadata: {os.path.basename(metadata_filename)}")
         
         # Display detailed summary
@@ -510,11 +658,23 @@ class LinkedInCompanyMonitor:
         print(f"  🎯 Source: {page_title}")
         print(f"  🔗 URL: {current_url}")
         print(f"  👥 Total profiles: {len(profiles)}")
-        print(f"  ✅ With names: {sum(1 for p in profiles if p.get('name') != 'Not found')}")
-        print(f"  💼 With titles: {sum(1 for p in profiles if p.get('title') != 'Not found')}")
-        print(f"  📍 With locations: {sum(1 for p in profiles if p.get('location') != 'Not found')}")
+        print(f"  ✅ With names: {n_name}")
+        print(f"  💼 With titles: {n_title}")
+        print(f"  📍 With locations: {n_loc}")
         print(f"  🕒 Extracted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    def write_csv(self, filename, profiles):
+        """Write profile rows to a CSV file"""
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=profiles[0].keys())
+            writer.writeheader()
+            writer.writerows(profiles)
+    
+    def write_json(self, filename, data):
+        """Write data to a pretty-printed JSON file"""
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
     def monitor_and_extract(self):
         """Main monitoring loop with enhanced features"""
         print("🚀 LinkedIn Company Monitor Started!")
@@ -553,13 +713,20 @@ class LinkedInCompanyMonitor:
             
             last_url = ""
             extraction_completed = set()
+            stable_ticks = 0
             
             while True:
                 try:
-                    current_url = self.driver.current_url
+                    # Read the URL once per tick; only session-gone errors mean the browser is closed,
+                    # anything else (alerts, timeouts) is retried by the handler below
+                    try:
+                        current_url = self.driver.current_url
+                    except (NoSuchWindowException, InvalidSessionIdException, MaxRetryError, ConnectionError):
+                        print("🔚 Browser closed, stopping monitor...")
+                        break
                     
                     # Check if we're on a company page and haven't extracted this page yet
-                    if self.detect_company_page() and current_url != last_url:
+                    if current_url != last_url and self.detect_company_page(current_url):
                         page_title = self.get_page_title()
                         
                         # Avoid duplicate extractions
@@ -601,17 +768,16 @@ class LinkedInCompanyMonitor:
                             else:
                                 print("   ⏩ Extraction skipped")
                     
+                    # Back off polling while the URL stays the same, reset on navigation
+                    if current_url != last_url:
+                        stable_ticks = 0
+                    else:
+                        stable_ticks += 1
                     last_url = current_url
                     
-                    # Check if browser is still open
-                    try:
-                        self.driver.current_url
-                    except:
-                        print("🔚 Browser closed, stopping monitor...")
-                        break
-                    
-                    # Wait before next check
-                    time.sleep(2)
+                    # Wait before next check (2s, 4s, 8s, then capped at 15s)
+                    sleep_s = min(15, 2 * (2 ** min(stable_ticks, 3)))
+                    time.sleep(sleep_s)
                     
                 except KeyboardInterrupt:
                     print("\n⏹️  Monitoring stopped by user")